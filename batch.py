@@ -8,13 +8,55 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
+import cache
 from config import BUSINESS, CONTENT_TYPES
-from optimizer import run_optimization
+from json_io import dumps
+from optimizer import make_async_client, run_optimization_async
+
+
+async def _run_batch(communities: list[str], args, run_started: datetime) -> list[dict]:
+    client = make_async_client()
+    semaphore = asyncio.Semaphore(args.max_parallel)
+
+    print_lock = asyncio.Lock()
+
+    async def _run_one(community: str) -> dict:
+        async with semaphore:
+            result = await run_optimization_async(
+                community=community, content_type=args.content_type,
+                iterations=args.iterations, model=args.model, verbose=True,
+                client=client, speculative=args.speculative, buffer_output=True,
+                run_time=run_started,
+            )
+        # Emit the whole community log in one write so concurrent tasks
+        # never interleave mid-report.
+        async with print_lock:
+            sys.stdout.write(f"\n{'─'*70}\n  {community}\n{'─'*70}\n{result['log']}\n")
+            sys.stdout.flush()
+        return result
+
+    tasks = [asyncio.create_task(_run_one(c)) for c in communities]
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = []
+    for community, outcome in zip(communities, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"  ✗ Error ({community}): {outcome}")
+            results.append({"community": community, "status": "error", "error": str(outcome)})
+        else:
+            results.append({
+                "community": community, "status": "success",
+                "best_score": outcome["best_score"], "iterations": outcome["iterations_run"],
+                "improvement": outcome["all_scores"][-1] - outcome["all_scores"][0] if len(outcome["all_scores"]) > 1 else 0,
+                "output": outcome["final_path"],
+            })
+    return results
 
 
 def main():
@@ -25,8 +67,21 @@ def main():
     parser.add_argument("--all", action="store_true", help="All configured communities")
     parser.add_argument("--iterations", type=int, default=5, help="Iterations per post (default: 5)")
     parser.add_argument("--model", default="claude-sonnet-4-5-20250929", help="Anthropic model")
+    parser.add_argument("--max-parallel", type=int, default=4,
+                        help="Concurrent communities (default: 4, bounded by API rate limits)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the CLAUDE_CACHE response cache")
+    parser.add_argument("--speculative", action="store_true",
+                        help="Run a second speculative improvement branch per iteration and keep the best")
 
     args = parser.parse_args()
+    run_started = datetime.now()
+
+    if args.content_type not in CONTENT_TYPES:
+        parser.error(f"Unknown content type: {args.content_type} "
+                     f"(available: {', '.join(CONTENT_TYPES.keys())})")
+
+    if args.no_cache:
+        cache.disable()
 
     if args.all:
         communities = BUSINESS["communities"]
@@ -41,27 +96,10 @@ def main():
     print(f"  Content type: {args.content_type}")
     print(f"  Communities:  {len(communities)}")
     print(f"  Iterations:   {args.iterations} per post")
+    print(f"  Parallelism:  {args.max_parallel}")
     print(f"{'='*70}\n")
 
-    results = []
-    for i, community in enumerate(communities, 1):
-        print(f"\n{'─'*70}")
-        print(f"  [{i}/{len(communities)}] {community}")
-        print(f"{'─'*70}")
-        try:
-            result = run_optimization(
-                community=community, content_type=args.content_type,
-                iterations=args.iterations, model=args.model, verbose=True,
-            )
-            results.append({
-                "community": community, "status": "success",
-                "best_score": result["best_score"], "iterations": result["iterations_run"],
-                "improvement": result["all_scores"][-1] - result["all_scores"][0] if len(result["all_scores"]) > 1 else 0,
-                "output": result["final_path"],
-            })
-        except Exception as e:
-            print(f"  ✗ Error: {e}")
-            results.append({"community": community, "status": "error", "error": str(e)})
+    results = asyncio.run(_run_batch(communities, args, run_started))
 
     # Summary
     print(f"\n\n{'='*70}")
@@ -79,9 +117,9 @@ def main():
             bar = "█" * bar_len + "░" * (40 - bar_len)
             print(f"  {r['community']:<20} {bar} {r['best_score']:.1f} ({r['improvement']:+.1f})")
 
-    report_path = Path("output") / f"batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    report_path = Path("output") / f"batch_report_{run_started.strftime('%Y%m%d_%H%M%S')}.json"
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(results, indent=2))
+    report_path.write_bytes(dumps(results))
     print(f"\n  Report: {report_path}")
     print(f"{'='*70}\n")
 
@@ -0,0 +1,49 @@
+"""
+Exact-match disk cache for Claude responses.
+
+Keys are SHA-256 hex digests of (model, prompt); entries live under
+output/.llm_cache/{key[:2]}/{key}.json. Safe here because no sampling
+parameters are varied between calls — the same prompt and model always
+map to an acceptable response. Off by default; enable with CLAUDE_CACHE=1
+(intended for development loops on the scoring code, not production runs).
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+CACHE_DIR = Path("output") / ".llm_cache"
+
+_disabled = False
+
+
+def disable() -> None:
+    """Force the cache off for this process (the --no-cache flag)."""
+    global _disabled
+    _disabled = True
+
+
+def enabled() -> bool:
+    return not _disabled and os.environ.get("CLAUDE_CACHE") == "1"
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def get(key: str) -> str | None:
+    path = _entry_path(key)
+    try:
+        return json.loads(path.read_text())["response"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+
+
+def set(key: str, value: str) -> None:
+    path = _entry_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "response": value,
+        "created_at": datetime.now().isoformat(),
+    }))
@@ -2,6 +2,8 @@
 Configuration for TD Realty Ohio SEO Blog Optimizer
 """
 
+from types import MappingProxyType
+
 BUSINESS = {
     "name": "TD Realty Ohio, LLC",
     "url": "https://tdrealtyohio.com",
@@ -12,12 +14,12 @@ BUSINESS = {
         "1% cashback for first-time homebuyers",
         "Free pre-listing inspections",
     ],
-    "communities": [
+    "communities": (
         "Westerville", "Dublin", "Powell", "Delaware", "Lewis Center",
         "Sunbury", "Galena", "Centerburg", "Johnstown", "New Albany",
         "Gahanna", "Reynoldsburg", "Pickerington", "Canal Winchester",
         "Grove City", "Hilliard", "Plain City",
-    ],
+    ),
     "phone": "(614) 300-1272",
     "founded": 2017,
 }
@@ -98,6 +100,16 @@ SCORING = {
     },
 }
 
+# Read-only view — the scorers only ever index into this; freezing the
+# top level guards against accidental mutation from library consumers.
+SCORING = MappingProxyType(SCORING)
+
+# Prompt-ready strings derived from BUSINESS, computed once at import so
+# every prompt build reuses byte-identical text (a requirement for the
+# Anthropic prompt-cache prefix to hit run-to-run).
+COMMUNITIES_JOINED = ", ".join(BUSINESS["communities"])
+SERVICES_BULLETED = "\n".join(f"  - {s}" for s in BUSINESS["services"])
+
 ITERATIONS = {
     "default_count": 5,
     "max_count": 15,
@@ -108,6 +120,9 @@ ITERATIONS = {
 OUTPUT = {
     "dir": "output",
     "save_all_versions": True,
+    # Store v0..vN as .md.zst — iterations are highly redundant and
+    # compress ~4x. FINAL.md always stays plain for human inspection.
+    "compress_versions": True,
     "final_format": "markdown",
 }
 
@@ -0,0 +1,26 @@
+"""
+JSON serialization helper — orjson when installed, stdlib fallback.
+
+Both paths return bytes suitable for Path.write_bytes, skipping the
+extra encode that write_text would do.
+"""
+
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+
+    def dumps_compact(obj) -> str:
+        """Minified JSON as str — for embedding in HTML/JSON-LD where
+        indentation is dead weight in the shipped page."""
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def dumps_compact(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -8,44 +8,159 @@ Usage:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import json
 import os
+import re
 import sys
 import time
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import anthropic
 
+try:
+    import zstandard as zstd
+    _ZSTD = zstd.ZstdCompressor(level=3)
+except ImportError:
+    _ZSTD = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+import cache
 from config import BUSINESS, CONTENT_TYPES, ITERATIONS, OUTPUT
+from json_io import dumps
 from scoring import score_post
 from prompts import get_generation_prompt, get_improvement_prompt
 
 
-def call_claude(client: anthropic.Anthropic, prompt: str, model: str) -> str:
-    message = client.messages.create(
+def make_async_client() -> anthropic.AsyncAnthropic:
+    """Build the shared API client: HTTP/2 multiplexing when httpx[http2]
+    is installed (many concurrent requests share one TLS connection) and
+    retries with backoff so 429s under parallel load don't fail a community.
+    """
+    kwargs: dict = {"max_retries": 5}
+    if httpx is not None:
+        try:
+            kwargs["http_client"] = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                timeout=120.0,
+            )
+        except ImportError:
+            # http2 extra (h2) not installed — fall back to SDK defaults.
+            pass
+    return anthropic.AsyncAnthropic(**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_keyword(pattern: str, community: str, year: int) -> str:
+    return pattern.format(community=community, year=year)
+
+
+_SLUG_TR = str.maketrans({" ": "-", "_": "-"})
+
+
+@functools.lru_cache(maxsize=None)
+def _slugify(community: str, content_type: str) -> str:
+    return f"{community.lower()}-{content_type}".translate(_SLUG_TR)
+
+
+def _cache_key(prompt: str | list[dict], model: str) -> str:
+    raw = prompt if isinstance(prompt, str) else json.dumps(prompt, sort_keys=True)
+    return hashlib.sha256(f"{model}\0{raw}".encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class IterationRecord:
+    iteration: int
+    score: float
+    percentage: float
+    generation_time: float
+    improvement: float = 0.0
+    category_scores: dict[str, float] = field(default_factory=dict)
+
+
+# Client-side prompt budget: skip calls doomed to fail on context length.
+_MAX_PROMPT_TOKENS = 180_000
+_token_counts: dict[str, int] = {}
+
+
+def _estimate_tokens(prompt: str | list[dict]) -> int:
+    """Cheap local estimate (~4 chars/token) — gates the real count_tokens
+    API call so the common small-prompt case never pays a roundtrip."""
+    text = prompt if isinstance(prompt, str) else "".join(b["text"] for b in prompt)
+    return len(text) // 4
+
+
+async def _ensure_prompt_fits(
+    client: anthropic.AsyncAnthropic,
+    prompt: str | list[dict],
+    model: str,
+    rebuild_trimmed,
+) -> str | list[dict]:
+    if _estimate_tokens(prompt) < _MAX_PROMPT_TOKENS // 2:
+        return prompt
+    key = _cache_key(prompt, model)
+    count = _token_counts.get(key)
+    if count is None:
+        result = await client.messages.count_tokens(
+            model=model, messages=[{"role": "user", "content": prompt}],
+        )
+        count = _token_counts[key] = result.input_tokens
+    if count > _MAX_PROMPT_TOKENS:
+        return rebuild_trimmed()
+    return prompt
+
+
+async def call_claude(client: anthropic.AsyncAnthropic, prompt: str | list[dict], model: str) -> str:
+    key = None
+    if cache.enabled():
+        key = _cache_key(prompt, model)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    # Stream rather than block on the full 8192-token response: chunks
+    # accumulate as they arrive, so under the parallel batch runner the
+    # event loop can service other communities during this generation.
+    chunks: list[str] = []
+    async with client.messages.stream(
         model=model,
         max_tokens=8192,
         messages=[{"role": "user", "content": prompt}],
-    )
-    return message.content[0].text
+    ) as stream:
+        async for text_chunk in stream.text_stream:
+            chunks.append(text_chunk)
+    text = "".join(chunks)
+
+    if key is not None:
+        cache.set(key, text)
+    return text
+
+
+# First fenced block (```markdown or bare ```) through the LAST closing
+# fence — greedy .* gives rindex semantics in a single pass.
+_FENCE_RE = re.compile(r"```(?:markdown)?\n(.*)```", re.DOTALL)
 
 
 def extract_markdown(response: str) -> str:
-    if "```markdown" in response:
-        start = response.index("```markdown") + len("```markdown")
-        end = response.rindex("```")
-        return response[start:end].strip()
-    elif "```" in response and response.strip().startswith("```"):
-        start = response.index("\n") + 1
-        end = response.rindex("```")
-        return response[start:end].strip()
-    if response.strip().startswith("---"):
-        return response.strip()
-    return response.strip()
+    stripped = response.strip()
+    if stripped.startswith("---"):
+        return stripped
+    m = _FENCE_RE.search(stripped)
+    if m:
+        return m.group(1).strip()
+    return stripped
 
 
-def run_optimization(
+async def run_optimization_async(
     community: str,
     content_type: str = "community_guide",
     primary_keyword: str | None = None,
@@ -53,17 +168,26 @@ def run_optimization(
     model: str = "claude-sonnet-4-5-20250929",
     output_dir: str | None = None,
     verbose: bool = True,
+    client: anthropic.AsyncAnthropic | None = None,
+    speculative: bool = False,
+    buffer_output: bool = False,
+    run_time: datetime | None = None,
 ) -> dict:
     if content_type not in CONTENT_TYPES:
-        print(f"Unknown content type: {content_type}")
-        print(f"Available: {', '.join(CONTENT_TYPES.keys())}")
-        sys.exit(1)
+        raise ValueError(
+            f"Unknown content type: {content_type} "
+            f"(available: {', '.join(CONTENT_TYPES.keys())})"
+        )
 
     ct = CONTENT_TYPES[content_type]
-    year = datetime.now().year
+    # One timestamp per run (batch.py passes its own) keeps keyword
+    # patterns and cache keys year-stable for the whole batch.
+    if run_time is None:
+        run_time = datetime.now()
+    year = run_time.year
 
     if not primary_keyword:
-        primary_keyword = ct["target_keywords_pattern"].format(community=community, year=year)
+        primary_keyword = _resolve_keyword(ct["target_keywords_pattern"], community, year)
     if iterations is None:
         iterations = ITERATIONS["default_count"]
     iterations = min(iterations, ITERATIONS["max_count"])
@@ -73,27 +197,43 @@ def run_optimization(
     out_path = Path(output_dir)
     out_path.mkdir(parents=True, exist_ok=True)
 
-    slug = f"{community.lower().replace(' ', '-')}-{content_type.replace('_', '-')}"
-    run_dir = out_path / slug
+    run_dir = out_path / _slugify(community, content_type)
     run_dir.mkdir(parents=True, exist_ok=True)
 
-    client = anthropic.Anthropic()
-
-    if verbose:
-        print(f"\n{'='*70}")
-        print(f"  SEO BLOG OPTIMIZER — RECURSIVE IMPROVEMENT ENGINE")
-        print(f"{'='*70}")
-        print(f"  Community:    {community}, Ohio")
-        print(f"  Content Type: {ct['description']}")
-        print(f"  Keyword:      {primary_keyword}")
-        print(f"  Model:        {model}")
-        print(f"  Iterations:   {iterations}")
-        print(f"  Output:       {run_dir}")
-        print(f"{'='*70}\n")
+    # Callers that loop over communities (batch.py) pass one shared client
+    # so every request rides the same connection pool — one TLS handshake
+    # for the whole batch. Only create (and later close) our own when run
+    # standalone.
+    owns_client = client is None
+    if owns_client:
+        client = make_async_client()
+
+    # Under the parallel batch runner, per-line prints from concurrent
+    # communities interleave unreadably — buffer_output collects the
+    # verbose log instead, and the caller emits it atomically. The
+    # joined log is returned either way under the "log" key.
+    log_lines: list[str] = []
+
+    def say(text: str = "") -> None:
+        if not verbose:
+            return
+        log_lines.append(text)
+        if not buffer_output:
+            print(text)
+
+    say(f"\n{'='*70}")
+    say(f"  SEO BLOG OPTIMIZER — RECURSIVE IMPROVEMENT ENGINE")
+    say(f"{'='*70}")
+    say(f"  Community:    {community}, Ohio")
+    say(f"  Content Type: {ct['description']}")
+    say(f"  Keyword:      {primary_keyword}")
+    say(f"  Model:        {model}")
+    say(f"  Iterations:   {iterations}")
+    say(f"  Output:       {run_dir}")
+    say(f"{'='*70}\n")
 
     # ── ITERATION 0: Generate initial version ────────────────────────
-    if verbose:
-        print("▶ Generating initial version (v0)...")
+    say("▶ Generating initial version (v0)...")
 
     gen_prompt = get_generation_prompt(
         primary_keyword=primary_keyword, community=community,
@@ -101,25 +241,38 @@ def run_optimization(
     )
 
     start_time = time.time()
-    response = call_claude(client, gen_prompt, model)
+    response = await call_claude(client, gen_prompt, model)
     gen_time = time.time() - start_time
 
     content = extract_markdown(response)
     report = score_post(content, primary_keyword, community, iteration=0)
 
-    if verbose:
-        print(f"  Generated in {gen_time:.1f}s")
-        print(f"\n{report.summary()}\n")
+    say(f"  Generated in {gen_time:.1f}s")
+    say(f"\n{report.summary()}\n")
+
+    # Artifact writes are handed to worker threads so the next Claude
+    # call starts immediately; everything is awaited before returning.
+    write_tasks: list[asyncio.Task] = []
+
+    def _write_later(path: Path, data: str | bytes) -> None:
+        writer = path.write_bytes if isinstance(data, bytes) else path.write_text
+        write_tasks.append(asyncio.create_task(asyncio.to_thread(writer, data)))
+
+    def _save_version(index: int, text: str) -> None:
+        if OUTPUT["compress_versions"] and _ZSTD is not None:
+            _write_later(run_dir / f"v{index}.md.zst", _ZSTD.compress(text.encode()))
+        else:
+            _write_later(run_dir / f"v{index}.md", text)
 
     if OUTPUT["save_all_versions"]:
-        (run_dir / "v0.md").write_text(content)
-        (run_dir / "v0_score.json").write_text(json.dumps(report.to_dict(), indent=2))
+        _save_version(0, content)
+        _write_later(run_dir / "v0_score.json", dumps(report.to_dict()))
 
-    history = [{
-        "iteration": 0, "score": report.total_score, "percentage": report.percentage,
-        "generation_time": gen_time,
-        "category_scores": {d.category: d.score for d in report.details},
-    }]
+    history = [IterationRecord(
+        iteration=0, score=report.total_score, percentage=report.percentage,
+        generation_time=gen_time,
+        category_scores={d.category: d.score for d in report.details},
+    )]
 
     best_content = content
     best_score = report.total_score
@@ -127,43 +280,80 @@ def run_optimization(
     plateau_count = 0
 
     # ── ITERATIONS 1-N: Recursive improvement ────────────────────────
-    for i in range(1, iterations + 1):
-        if verbose:
-            print(f"▶ Improvement iteration {i}/{iterations}...")
+    prev_content: str | None = None
+    prev_report = None
 
-        improvement_prompt = get_improvement_prompt(
-            content=content, score_report_dict=report.to_dict(),
-            primary_keyword=primary_keyword, community=community, iteration=i,
-        )
+    for i in range(1, iterations + 1):
+        say(f"▶ Improvement iteration {i}/{iterations}...")
+
+        # In speculative mode we keep a beam of 2: improve the current
+        # draft AND re-improve the previous one concurrently, then keep
+        # whichever candidate scores higher. Both calls overlap on the
+        # wire, so when improvements are marginal this halves wall time
+        # at the cost of the extra (cacheable) API call.
+        branch_inputs = [(content, report)]
+        if speculative and prev_content is not None:
+            branch_inputs.append((prev_content, prev_report))
+
+        prompts_to_try = []
+        for b_content, b_report in branch_inputs:
+            prompt = get_improvement_prompt(
+                content=b_content, score_report_dict=b_report.to_dict(),
+                primary_keyword=primary_keyword, community=community, iteration=i,
+            )
+            prompt = await _ensure_prompt_fits(
+                client, prompt, model,
+                rebuild_trimmed=lambda c=b_content, r=b_report: get_improvement_prompt(
+                    content=c, score_report_dict=r.to_dict(),
+                    primary_keyword=primary_keyword, community=community,
+                    iteration=i, include_all_suggestions=False,
+                ),
+            )
+            prompts_to_try.append(prompt)
 
         start_time = time.time()
-        response = call_claude(client, improvement_prompt, model)
+        responses = await asyncio.gather(
+            *(call_claude(client, p, model) for p in prompts_to_try)
+        )
         iter_time = time.time() - start_time
 
-        new_content = extract_markdown(response)
-        new_report = score_post(new_content, primary_keyword, community, iteration=i)
+        candidates = []
+        for response in responses:
+            cand_content = extract_markdown(response)
+            cand_report = score_post(cand_content, primary_keyword, community, iteration=i)
+            candidates.append((cand_content, cand_report))
+
+        new_content, new_report = max(candidates, key=lambda c: c[1].total_score)
+        if len(candidates) > 1:
+            say(f"  Speculative branch scores: {', '.join(f'{r.total_score:.1f}' for _, r in candidates)}")
+
+        prev_content, prev_report = content, report
         improvement = new_report.total_score - report.total_score
 
-        if verbose:
-            print(f"  Completed in {iter_time:.1f}s")
-            print(f"\n{new_report.summary()}")
-            delta = "↑" if improvement > 0 else "↓" if improvement < 0 else "→"
-            print(f"\n  {delta} Change from last iteration: {improvement:+.1f} points\n")
+        say(f"  Completed in {iter_time:.1f}s")
+        say(f"\n{new_report.summary()}")
+        delta = "↑" if improvement > 0 else "↓" if improvement < 0 else "→"
+        say(f"\n  {delta} Change from last iteration: {improvement:+.1f} points\n")
 
         if OUTPUT["save_all_versions"]:
-            (run_dir / f"v{i}.md").write_text(new_content)
-            (run_dir / f"v{i}_score.json").write_text(json.dumps(new_report.to_dict(), indent=2))
+            _save_version(i, new_content)
+            _write_later(run_dir / f"v{i}_score.json", dumps(new_report.to_dict()))
 
-        history.append({
-            "iteration": i, "score": new_report.total_score, "percentage": new_report.percentage,
-            "generation_time": iter_time, "improvement": improvement,
-            "category_scores": {d.category: d.score for d in new_report.details},
-        })
+        history.append(IterationRecord(
+            iteration=i, score=new_report.total_score, percentage=new_report.percentage,
+            generation_time=iter_time, improvement=improvement,
+            category_scores={d.category: d.score for d in new_report.details},
+        ))
 
         if new_report.total_score > best_score:
             best_content = new_content
             best_score = new_report.total_score
             best_iteration = i
+
+        # Plateau counts any iteration whose delta falls below the
+        # configured threshold — flat (→) rounds no longer burn the full
+        # iteration budget waiting for a strictly-worse score.
+        if improvement >= ITERATIONS["improvement_threshold"]:
             plateau_count = 0
         else:
             plateau_count += 1
@@ -171,51 +361,81 @@ def run_optimization(
         content = new_content
         report = new_report
 
+        if best_score >= 95:
+            say(f"  ✔ Score {best_score:.1f} is near ceiling. Stopping.\n")
+            break
+
         if plateau_count >= ITERATIONS["plateau_patience"]:
-            if verbose:
-                print(f"  ⚠ Plateau detected — no improvement for {plateau_count} iterations. Stopping.\n")
+            say(f"  ⚠ Plateau detected — stopping: Δ<{ITERATIONS['improvement_threshold']} "
+                f"for {plateau_count} iterations.\n")
             break
 
     # ── FINALIZE ─────────────────────────────────────────────────────
     final_path = run_dir / "FINAL.md"
-    final_path.write_text(best_content)
+    _write_later(final_path, best_content)
 
+    history_dicts = [asdict(r) for r in history]
     summary = {
         "community": community, "content_type": content_type,
         "primary_keyword": primary_keyword, "model": model,
         "best_score": best_score, "best_iteration": best_iteration,
-        "total_iterations": len(history) - 1, "history": history,
+        "total_iterations": len(history) - 1, "history": history_dicts,
         "timestamp": datetime.now().isoformat(),
     }
-    (run_dir / "run_summary.json").write_text(json.dumps(summary, indent=2))
-
-    if verbose:
-        print(f"\n{'='*70}")
-        print(f"  OPTIMIZATION COMPLETE")
-        print(f"{'='*70}")
-        print(f"  Best score:     {best_score:.1f}/100 ({best_score:.1f}%)")
-        print(f"  Best iteration: v{best_iteration}")
-        print(f"  Improvement:    {best_score - history[0]['score']:+.1f} points from v0")
-        print(f"  Output:         {final_path}")
-        print()
-        print("  SCORE PROGRESSION:")
-        for h in history:
-            bar_len = int(h["percentage"] / 2.5)
-            bar = "█" * bar_len + "░" * (40 - bar_len)
-            delta = f" ({h.get('improvement', 0):+.1f})" if "improvement" in h else ""
-            print(f"    v{h['iteration']}: {bar} {h['score']:.1f}{delta}")
-        print(f"{'='*70}\n")
+    _write_later(run_dir / "run_summary.json", dumps(summary))
+
+    if write_tasks:
+        await asyncio.gather(*write_tasks)
+
+    say(f"\n{'='*70}")
+    say(f"  OPTIMIZATION COMPLETE")
+    say(f"{'='*70}")
+    say(f"  Best score:     {best_score:.1f}/100 ({best_score:.1f}%)")
+    say(f"  Best iteration: v{best_iteration}")
+    say(f"  Improvement:    {best_score - history[0].score:+.1f} points from v0")
+    say(f"  Output:         {final_path}")
+    say()
+    say("  SCORE PROGRESSION:")
+    for h in history:
+        bar_len = int(h.percentage / 2.5)
+        bar = "█" * bar_len + "░" * (40 - bar_len)
+        delta = f" ({h.improvement:+.1f})" if h.iteration else ""
+        say(f"    v{h.iteration}: {bar} {h.score:.1f}{delta}")
+    say(f"{'='*70}\n")
+
+    if owns_client:
+        await client.close()
 
     return {
         "best_content": best_content, "best_score": best_score,
         "best_iteration": best_iteration,
-        "all_scores": [h["score"] for h in history],
+        "all_scores": [r.score for r in history],
         "iterations_run": len(history) - 1,
-        "improvement_history": history,
+        "improvement_history": history_dicts,
         "output_dir": str(run_dir), "final_path": str(final_path),
+        "log": "\n".join(log_lines),
     }
 
 
+def run_optimization(
+    community: str,
+    content_type: str = "community_guide",
+    primary_keyword: str | None = None,
+    iterations: int | None = None,
+    model: str = "claude-sonnet-4-5-20250929",
+    output_dir: str | None = None,
+    verbose: bool = True,
+    speculative: bool = False,
+) -> dict:
+    """Synchronous entry point — runs a single community end-to-end."""
+    return asyncio.run(run_optimization_async(
+        community=community, content_type=content_type,
+        primary_keyword=primary_keyword, iterations=iterations,
+        model=model, output_dir=output_dir, verbose=verbose,
+        speculative=speculative,
+    ))
+
+
 def main():
     parser = argparse.ArgumentParser(description="SEO Blog Optimizer for TD Realty Ohio")
     parser.add_argument("--community", required=True, help=f"Target community: {', '.join(BUSINESS['communities'])}")
@@ -227,9 +447,19 @@ def main():
     parser.add_argument("--model", default="claude-sonnet-4-5-20250929", help="Anthropic model")
     parser.add_argument("--output-dir", default=None, help=f"Output directory (default: {OUTPUT['dir']})")
     parser.add_argument("--quiet", action="store_true", help="Suppress verbose output")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the CLAUDE_CACHE response cache")
+    parser.add_argument("--speculative", action="store_true",
+                        help="Run a second speculative improvement branch per iteration and keep the best")
 
     args = parser.parse_args()
 
+    if args.content_type not in CONTENT_TYPES:
+        parser.error(f"Unknown content type: {args.content_type} "
+                     f"(available: {', '.join(CONTENT_TYPES.keys())})")
+
+    if args.no_cache:
+        cache.disable()
+
     if args.community not in BUSINESS["communities"]:
         match = next((c for c in BUSINESS["communities"] if c.lower() == args.community.lower()), None)
         if match:
@@ -241,6 +471,7 @@ def main():
         community=args.community, content_type=args.content_type,
         primary_keyword=args.keyword, iterations=args.iterations,
         model=args.model, output_dir=args.output_dir, verbose=not args.quiet,
+        speculative=args.speculative,
     )
 
 
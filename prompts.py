@@ -1,39 +1,27 @@
 """
 Prompt templates for SEO blog post generation and iterative improvement.
-"""
-
-from config import BUSINESS
 
+Prompts are returned as lists of Anthropic content blocks so the static
+business/format preamble can be marked with `cache_control` — the API then
+reuses the cached prefix across every generation in a batch instead of
+re-processing the same ~1.5KB of tokens per call.
+"""
 
-def get_generation_prompt(
-    primary_keyword: str,
-    community: str,
-    content_type: str,
-    content_type_description: str,
-    year: int = 2025,
-) -> str:
-    communities_list = ", ".join(BUSINESS["communities"])
-    services_list = "\n".join(f"  - {s}" for s in BUSINESS["services"])
+from config import BUSINESS, COMMUNITIES_JOINED, SERVICES_BULLETED
 
-    return f"""You are an expert real estate SEO content writer creating a blog post for TD Realty Ohio, LLC — a discount real estate brokerage serving Central Ohio since 2017.
+# Static prefix shared by every generation call — byte-identical across
+# communities/keywords so the Anthropic prompt cache can hit on it.
+_GENERATION_PREFIX = f"""You are an expert real estate SEO content writer creating a blog post for TD Realty Ohio, LLC — a discount real estate brokerage serving Central Ohio since 2017.
 
 ## BUSINESS CONTEXT
 
 - Company: {BUSINESS['name']}
 - Website: {BUSINESS['url']}
 - Services:
-  {services_list}
-- Communities served: {communities_list}
+  {SERVICES_BULLETED}
+- Communities served: {COMMUNITIES_JOINED}
 - Phone: {BUSINESS['phone']}
 
-## ASSIGNMENT
-
-Write a **{content_type_description}** blog post targeting the community of **{community}, Ohio**.
-
-## TARGET KEYWORD
-
-Primary keyword: **{primary_keyword}**
-
 ## REQUIREMENTS
 
 ### Format
@@ -48,7 +36,7 @@ Primary keyword: **{primary_keyword}**
 - Include the keyword in: title, first 100 words, at least one H2, and meta description
 - Use 3-6 H2 headings with H3 sub-sections for depth
 - Include concrete local details: school districts, parks, ZIP codes, landmarks, neighborhoods
-- Reference nearby communities ({communities_list}) for cross-linking
+- Reference nearby communities ({COMMUNITIES_JOINED}) for cross-linking
 - Include market statistics, data points, and percentage comparisons
 - Add an FAQ section with 3-5 common questions
 - Include 2-3 natural calls to action referencing TD Realty's services
@@ -71,10 +59,47 @@ Primary keyword: **{primary_keyword}**
 - 3-6 H2 sections
 - H3 sub-sections where appropriate
 - Short paragraphs (2-4 sentences) for web readability
-- Logical heading hierarchy (never skip levels)
+- Logical heading hierarchy (never skip levels)"""
+
+# Static improvement rules — identical for every improvement iteration.
+_IMPROVEMENT_PREFIX = """You are improving an SEO blog post for TD Realty Ohio, LLC. You will receive the current draft, its automated SEO score breakdown, and targeted suggestions.
+
+## INSTRUCTIONS
+
+Rewrite the blog post to address the improvement suggestions, focusing especially on the 3 lowest-scoring categories. Important rules:
+
+- Keep all improvements that scored well — don't regress on high-scoring areas
+- Maintain natural, readable prose — don't sacrifice quality for metrics
+- Stay within 1,500-2,500 words
+- Keep keyword usage natural (0.8%-2.0% density)
+- Preserve the YAML frontmatter format
+- DO NOT use the word "nestled" or cliche real estate filler
+
+Output ONLY the complete improved markdown blog post starting with the --- frontmatter delimiter. No additional commentary."""
+
+
+def get_generation_prompt(
+    primary_keyword: str,
+    community: str,
+    content_type: str,
+    content_type_description: str,
+    year: int = 2025,
+) -> list[dict]:
+    dynamic_tail = f"""## ASSIGNMENT
+
+Write a **{content_type_description}** blog post targeting the community of **{community}, Ohio**.
+
+## TARGET KEYWORD
+
+Primary keyword: **{primary_keyword}**
 
 Write the complete blog post now. Output ONLY the markdown content starting with the --- frontmatter delimiter. No additional commentary."""
 
+    return [
+        {"type": "text", "text": _GENERATION_PREFIX, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": dynamic_tail},
+    ]
+
 
 def get_improvement_prompt(
     content: str,
@@ -82,7 +107,8 @@ def get_improvement_prompt(
     primary_keyword: str,
     community: str,
     iteration: int,
-) -> str:
+    include_all_suggestions: bool = True,
+) -> list[dict]:
     categories = sorted(score_report_dict["categories"], key=lambda x: x["percentage"])
     worst_3 = categories[:3]
 
@@ -99,39 +125,49 @@ def get_improvement_prompt(
         for s in cat["suggestions"]:
             all_suggestions.append(f"[{cat['category']}] {s}")
 
-    return f"""You are improving an SEO blog post for TD Realty Ohio, LLC targeting **{community}, Ohio** with primary keyword **"{primary_keyword}"**.
-
-## CURRENT SCORE: {score_report_dict['total_score']}/{score_report_dict['max_possible']} ({score_report_dict['percentage']:.1f}%)
+    # Block order is deliberate: static instructions, then the run-stable
+    # target line, then the previous draft, then the volatile score data
+    # LAST. The draft block carries its own cache breakpoint so, across
+    # iterations, the prefix up through the prior post body can be served
+    # from the Anthropic cache — only the trailing score block misses.
+    target_block = f"""## TARGET
 
-This is improvement iteration #{iteration}.
+Community: **{community}, Ohio** — primary keyword: **"{primary_keyword}"**"""
 
-## PRIORITY IMPROVEMENT AREAS (lowest-scoring categories):
+    content_block = f"""## CURRENT BLOG POST:
 
-{chr(10).join(improvement_instructions)}
+```markdown
+{content}
+```"""
 
-## ALL SUGGESTIONS:
+    # The exhaustive suggestion list is the most dispensable section —
+    # callers drop it (include_all_suggestions=False) when the prompt
+    # would otherwise exceed the context budget.
+    all_suggestions_section = ""
+    if include_all_suggestions:
+        all_suggestions_section = f"""## ALL SUGGESTIONS:
 
 {chr(10).join(f"- {s}" for s in all_suggestions)}
 
-## FULL SCORE BREAKDOWN:
+"""
 
-{chr(10).join(f"- {cat['category']}: {cat['score']}/{cat['max_score']} ({cat['percentage']:.0f}%)" for cat in categories)}
+    score_block = f"""## CURRENT SCORE: {score_report_dict['total_score']}/{score_report_dict['max_possible']} ({score_report_dict['percentage']:.1f}%)
 
-## CURRENT BLOG POST:
+This is improvement iteration #{iteration}.
 
-```markdown
-{content}
-```
+## PRIORITY IMPROVEMENT AREAS (lowest-scoring categories):
 
-## INSTRUCTIONS
+{chr(10).join(improvement_instructions)}
 
-Rewrite the blog post to address the improvement suggestions above, focusing especially on the 3 lowest-scoring categories. Important rules:
+{all_suggestions_section}## FULL SCORE BREAKDOWN:
 
-- Keep all improvements that scored well — don't regress on high-scoring areas
-- Maintain natural, readable prose — don't sacrifice quality for metrics
-- Stay within 1,500-2,500 words
-- Keep keyword usage natural (0.8%-2.0% density)
-- Preserve the YAML frontmatter format
-- DO NOT use the word "nestled" or cliche real estate filler
+{chr(10).join(f"- {cat['category']}: {cat['score']}/{cat['max_score']} ({cat['percentage']:.0f}%)" for cat in categories)}
 
-Output ONLY the complete improved markdown blog post starting with the --- frontmatter delimiter. No additional commentary."""
+Now output the complete improved markdown blog post."""
+
+    return [
+        {"type": "text", "text": _IMPROVEMENT_PREFIX, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": target_block},
+        {"type": "text", "text": content_block, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": score_block},
+    ]
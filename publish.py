@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+Publisher — convert an optimized FINAL.md blog post into a ready-to-deploy
+HTML page for tdrealtyohio.com (article layout, FAQ section, JSON-LD).
+
+Usage:
+    python publish.py --input output/powell-community-guide/FINAL.md
+    python publish.py --input output/powell-community-guide/FINAL.md --dry-run
+"""
+
+import hashlib
+import html
+import re
+import shutil
+import string
+import sys
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+
+from config import BUSINESS
+from json_io import dumps_compact
+
+# yaml is the heaviest import here (~30ms) and only needed once a post
+# with frontmatter is actually parsed — library consumers of slugify /
+# markdown_to_html shouldn't pay for it. Loaded on first use.
+_YAML = None
+
+
+def _get_yaml():
+    global _YAML
+    if _YAML is None:
+        import yaml
+
+        # libyaml's C parser is an order of magnitude faster than the
+        # pure-Python loader; fall back when PyYAML was built without it.
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+        _YAML = (yaml, loader)
+    return _YAML
+
+# All patterns are compiled once at import — the conversion hot path is
+# regex-dominated, and explicit compilation keeps us independent of the
+# re module's internal cache.
+_FM_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+_BLOCK_SPLIT_RE = re.compile(r'\n\s*\n')
+
+# Single-scan slug table: whitespace/underscore become dashes and
+# punctuation drops out, replacing three sequential regex substitutions.
+_SLUG_TABLE = str.maketrans(
+    {c: "-" for c in " \t\n\r_"} | {c: None for c in string.punctuation if c not in "-_"}
+)
+# Links, bold, and italic in one alternation so inline formatting is a
+# single left-to-right scan instead of three sequential sub passes.
+_INLINE_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)|\*\*([^*]+)\*\*|\*([^*]+)\*')
+_FAQ_SECTION_RE = re.compile(r'(?i)(faq|frequently asked|common questions)')
+_Q_BOLD_RE = re.compile(r'^\*\*(.+\?)\*\*\s*$')
+
+
+# Published pages are content-addressed: identical markdown produces
+# identical HTML, so republishing an unchanged post is a file copy.
+# Bump _TEMPLATE_VERSION whenever the page templates change so stale
+# cached pages are regenerated.
+_TEMPLATE_VERSION = 1
+_CACHE_DIR = Path(".publish-cache")
+
+
+def _page_cache_key(content: bytes) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"tmpl{_TEMPLATE_VERSION}\n".encode())
+    h.update(content)
+    return h.hexdigest()
+
+
+# The complete page skeleton, materialized once at import. Business
+# fields (site name, phone, tagline) never change per post, so they are
+# baked in here; only the {named} per-post fields are filled in
+# build_html with a single format_map pass over the constant.
+_PAGE_TMPL = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>{{title}} | {BUSINESS['name']}</title>
+  <meta name="description" content="{{description}}">
+  <meta name="keywords" content="{{keywords}}">
+  <link rel="canonical" href="{{page_url}}">
+  <meta property="og:type" content="article">
+  <meta property="og:title" content="{{title}}">
+  <meta property="og:description" content="{{description}}">
+  <meta property="og:url" content="{{page_url}}">
+  <meta property="og:site_name" content="{BUSINESS['name']}">
+  <meta name="twitter:card" content="summary">
+  <meta name="twitter:title" content="{{title}}">
+  <meta name="twitter:description" content="{{description}}">
+  <link rel="stylesheet" href="/css/styles.css">
+  <script type="application/ld+json">
+{{article_schema}}
+  </script>{{faq_schema_block}}
+</head>
+<body>
+  <header class="site-header">
+    <nav class="nav">
+      <a href="/" class="logo">{BUSINESS['name']}</a>
+      <ul class="nav-links">
+        <li><a href="/communities">Communities</a></li>
+        <li><a href="/sell-your-home">Sell</a></li>
+        <li><a href="/buy-a-home">Buy</a></li>
+        <li><a href="/blog">Blog</a></li>
+        <li><a href="/contact">Contact</a></li>
+      </ul>
+    </nav>
+  </header>
+
+  <main class="article-page">
+    <nav class="breadcrumb">
+      <a href="/">Home</a> &rsaquo; <a href="/blog">Blog</a> &rsaquo; <span>{{breadcrumb_label}}</span>
+    </nav>
+
+    <article>
+      <header class="article-header">
+        <p class="article-meta">{{category}} &middot; {{display_date}}</p>
+        <h1>{{title}}</h1>
+      </header>
+{{article_html}}{{faq_section}}    </article>
+
+    <aside class="article-cta">
+      <h2>Ready to Save Thousands{{cta_location}}?</h2>
+      <p>{BUSINESS['tagline']} — list your home for as little as 1% commission,
+      or earn 1% cashback as a first-time buyer.</p>
+      <p><a class="cta-button" href="/contact">Get Started</a> or call {BUSINESS['phone']}</p>
+    </aside>
+  </main>
+
+  <footer class="site-footer">
+    <p>&copy; {datetime.now().year} {BUSINESS['name']}. All rights reserved.</p>
+    <p>Licensed real estate brokerage serving Central Ohio since {BUSINESS['founded']}.</p>
+    <p class="compliance">
+      <span class="equal-housing" title="Equal Housing Opportunity">&#8962;</span>
+      Equal Housing Opportunity &middot; REALTOR&reg;
+    </p>
+  </footer>
+</body>
+</html>
+"""
+
+
+_MONTHS = ("January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December")
+
+
+def _display_date(date_str: str) -> str:
+    """Format an ISO `YYYY-MM-DD` date as `Month DD, YYYY` by slicing —
+    strptime re-runs its locale/regex machinery on every call for what
+    is three int conversions here. Anything non-ISO passes through."""
+    if len(date_str) < 10 or date_str[4] != "-" or date_str[7] != "-":
+        return date_str
+    try:
+        d = datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+    except ValueError:
+        return date_str
+    return f"{_MONTHS[d.month - 1]} {d.day:02d}, {d.year}"
+
+
+def parse_frontmatter(content: str) -> tuple[dict, str]:
+    frontmatter = {}
+    body = content
+    fm_match = _FM_RE.match(content)
+    if fm_match:
+        yaml, loader = _get_yaml()
+        try:
+            frontmatter = yaml.load(fm_match.group(1), Loader=loader) or {}
+        except yaml.YAMLError:
+            frontmatter = {}
+        body = fm_match.group(2)
+    return frontmatter, body
+
+
+def slugify(text: str) -> str:
+    slug = text.lower().translate(_SLUG_TABLE)
+    while "--" in slug:
+        slug = slug.replace("--", "-")
+    return slug.strip("-")
+
+
+def _inline_sub(m: re.Match) -> str:
+    if m.group(1) is not None:
+        return f'<a href="{m.group(2)}">{m.group(1)}</a>'
+    if m.group(3) is not None:
+        return f"<strong>{m.group(3)}</strong>"
+    return f"<em>{m.group(4)}</em>"
+
+
+def inline_format(text: str) -> str:
+    return _INLINE_RE.sub(_inline_sub, text)
+
+
+def _strip_md(s: str) -> str:
+    """Strip links, bold, and italic markers in one scan-and-copy pass —
+    plain string scanning beats three sequential regex substitutions for
+    markup this simple, and avoids two intermediate string copies."""
+    out = []
+    i = 0
+    start = 0
+    n = len(s)
+    while i < n:
+        c = s[i]
+        if c == "[":
+            close = s.find("]", i + 1)
+            if close != -1 and s[close + 1:close + 2] == "(":
+                paren = s.find(")", close + 2)
+                if paren != -1:
+                    out.append(s[start:i])
+                    out.append(s[i + 1:close])
+                    i = paren + 1
+                    start = i
+                    continue
+        elif c == "*":
+            out.append(s[start:i])
+            i += 2 if s[i + 1:i + 2] == "*" else 1
+            start = i
+            continue
+        i += 1
+    out.append(s[start:])
+    return "".join(out)
+
+
+def _heading_level(s: str) -> int:
+    """Leading-# count for a heading line, 0 if not a heading."""
+    level = 0
+    while level < 6 and s[level:level + 1] == "#":
+        level += 1
+    return level if s[level:level + 1] == " " else 0
+
+
+def _ol_item(s: str) -> str | None:
+    """Item text for an `N. item` ordered-list line, else None."""
+    dot = s.find(".")
+    if dot <= 0 or not s[:dot].isdigit() or not s[dot + 1:dot + 2].isspace():
+        return None
+    return s[dot + 1:].strip()
+
+
+def markdown_to_html(body: str, out: StringIO) -> list[tuple[str, str]]:
+    """Convert the markdown body to HTML, writing directly into `out`,
+    and return the FAQ (question, answer) pairs encountered along the way.
+
+    The body is split on blank-line boundaries and each block is
+    dispatched on its first character (heading / ul / ol / paragraph).
+    Structural markers are recognised with prefix checks and slicing —
+    the C-level string primitives are far cheaper per line than regex
+    match objects, and the only pattern left in the hot loop is the
+    inline-formatting alternation. FAQ capture shares the same pass
+    rather than re-tokenizing the body.
+    """
+    faqs: list[tuple[str, str]] = []
+    # One substring search up front: most of the FAQ bookkeeping (and the
+    # per-H2 section match below) is skipped outright for posts that have
+    # no FAQ heading anywhere.
+    has_faq = _FAQ_SECTION_RE.search(body) is not None
+    in_faq_section = False
+    current_question = None
+    answer_parts: list[str] = []
+
+    def harvest() -> None:
+        nonlocal current_question, answer_parts
+        if current_question and answer_parts:
+            faqs.append((current_question, _strip_md(" ".join(answer_parts)).strip()))
+        current_question = None
+        answer_parts = []
+
+    for block in _BLOCK_SPLIT_RE.split(body.strip()):
+        block = block.strip()
+        if not block:
+            continue
+
+        first = block[0]
+
+        if first == "#":
+            # Heading block — usually a single line, but tolerate a
+            # trailing intro line in the same block.
+            for line in block.splitlines():
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                level = _heading_level(stripped)
+                if level:
+                    text = stripped[level + 1:].strip()
+                    if level == 2:
+                        harvest()
+                        in_faq_section = has_faq and bool(_FAQ_SECTION_RE.search(text))
+                    elif level == 3 and in_faq_section:
+                        harvest()
+                        if text.endswith("?"):
+                            current_question = text
+                    out.write(f"<h{level}>{inline_format(text)}</h{level}>\n")
+                else:
+                    if in_faq_section and current_question:
+                        answer_parts.append(stripped)
+                    out.write(f"<p>{inline_format(stripped)}</p>\n")
+            continue
+
+        if first in "-*" and block[1:2] == " ":
+            out.write("<ul>\n")
+            for line in block.splitlines():
+                stripped = line.strip()
+                if stripped[:2] in ("- ", "* "):
+                    out.write(f"<li>{inline_format(stripped[2:].strip())}</li>\n")
+            out.write("</ul>\n")
+            continue
+
+        if first.isdigit() and _ol_item(block.split("\n", 1)[0].strip()) is not None:
+            out.write("<ol>\n")
+            for line in block.splitlines():
+                item = _ol_item(line.strip())
+                if item is not None:
+                    out.write(f"<li>{inline_format(item)}</li>\n")
+            out.write("</ol>\n")
+            continue
+
+        # Paragraph. Blocks are single lines in the common case — join
+        # only when a paragraph actually wraps, and build the text once
+        # so the FAQ-answer path reuses it instead of re-joining.
+        if "\n" in block:
+            text = " ".join(line.strip() for line in block.splitlines())
+        else:
+            text = block
+
+        if in_faq_section:
+            head_line, _, rest = block.partition("\n")
+            bold_q = _Q_BOLD_RE.match(head_line.strip())
+            if bold_q:
+                harvest()
+                current_question = bold_q.group(1).strip()
+                out.write("<p>")
+                out.write(inline_format(head_line.strip()))
+                out.write("</p>\n")
+                if rest.strip():
+                    tail = " ".join(l.strip() for l in rest.splitlines() if l.strip())
+                    answer_parts.append(tail)
+                    out.write("<p>")
+                    out.write(inline_format(tail))
+                    out.write("</p>\n")
+                continue
+            if current_question:
+                answer_parts.append(text)
+
+        out.write("<p>")
+        out.write(inline_format(text))
+        out.write("</p>\n")
+
+    harvest()
+    return faqs
+
+
+def extract_faq_items(body: str) -> list[tuple[str, str]]:
+    """Backward-compatible wrapper — FAQ capture now happens inside the
+    single `markdown_to_html` pass; this just discards the HTML."""
+    if _FAQ_SECTION_RE.search(body) is None:
+        return []
+    return markdown_to_html(body, StringIO())
+
+
+def build_faq_html(faqs: list[tuple[str, str]], out: StringIO) -> None:
+    for question, answer in faqs:
+        out.write('      <div class="faq-item">\n')
+        out.write(f"        <h3>{html.escape(question)}</h3>\n")
+        out.write(f"        <p>{html.escape(answer)}</p>\n")
+        out.write("      </div>\n")
+
+
+def build_faq_structured_data(faqs: list[tuple[str, str]]) -> str:
+    if not faqs:
+        return ""
+    data = {
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+        "mainEntity": [
+            {
+                "@type": "Question",
+                "name": question,
+                "acceptedAnswer": {"@type": "Answer", "text": answer},
+            }
+            for question, answer in faqs
+        ],
+    }
+    # Compact output — the schema sits inside a <script> tag where
+    # indentation is just extra bytes on the wire.
+    return dumps_compact(data)
+
+
+def build_html(frontmatter: dict, body_md: str) -> str:
+    title = frontmatter.get("title", "Untitled Post")
+    description = frontmatter.get("description", "")
+    date_str = str(frontmatter.get("date", datetime.now().strftime("%Y-%m-%d")))
+    keywords = frontmatter.get("keywords", [])
+    if isinstance(keywords, list):
+        keywords = ", ".join(keywords)
+    community = frontmatter.get("community", "")
+    category = frontmatter.get("category", "Blog")
+
+    display_date = _display_date(date_str)
+
+    slug = slugify(title)
+    page_url = f"{BUSINESS['url']}/blog/{slug}"
+
+    # Escape each field exactly once — title alone lands in seven spots
+    # across the template, and breadcrumb/CTA reuse the community string.
+    category_esc = html.escape(category)
+    community_esc = html.escape(community) if community else ""
+    breadcrumb_esc = community_esc if community else category_esc
+
+    # One pass over the markdown produces both the article HTML and the
+    # FAQ pairs (needed up front for the JSON-LD block in <head>).
+    article_buf = StringIO()
+    faqs = markdown_to_html(body_md, article_buf)
+    faq_schema = build_faq_structured_data(faqs)
+
+    faq_schema_block = ""
+    if faq_schema:
+        faq_schema_block = f"""
+  <script type="application/ld+json">
+{faq_schema}
+  </script>"""
+
+    article_schema = dumps_compact({
+        "@context": "https://schema.org",
+        "@type": "BlogPosting",
+        "headline": title,
+        "description": description,
+        "datePublished": date_str,
+        "author": {"@type": "Organization", "name": BUSINESS["name"], "url": BUSINESS["url"]},
+        "publisher": {"@type": "Organization", "name": BUSINESS["name"], "url": BUSINESS["url"]},
+        "mainEntityOfPage": page_url,
+        "keywords": keywords,
+    })
+
+    faq_section = ""
+    if faqs:
+        faq_buf = StringIO()
+        faq_buf.write('\n    <section class="faq-section" id="faq">\n')
+        build_faq_html(faqs, faq_buf)
+        faq_buf.write("    </section>\n")
+        faq_section = faq_buf.getvalue()
+
+    # One substitution pass over the import-time skeleton; everything
+    # static — including the escaped business fields — was folded into
+    # the constant when the module loaded.
+    return _PAGE_TMPL.format_map({
+        "title": html.escape(title),
+        "description": html.escape(description),
+        "keywords": html.escape(keywords),
+        "page_url": page_url,
+        "article_schema": article_schema,
+        "faq_schema_block": faq_schema_block,
+        "breadcrumb_label": breadcrumb_esc,
+        "category": category_esc,
+        "display_date": display_date,
+        "article_html": article_buf.getvalue(),
+        "faq_section": faq_section,
+        "cta_location": f" in {community_esc}" if community else "",
+    })
+
+
+_CARD_TMPL = """<div class="blog-card">
+  <p class="blog-card-meta">{category} &middot; {display_date}</p>
+  <h3><a href="/blog/{slug}">{title}</a></h3>
+  <p>{description}</p>
+</div>"""
+
+
+def generate_blog_card(frontmatter: dict, slug: str) -> str:
+    title = frontmatter.get("title", "Untitled Post")
+    description = frontmatter.get("description", "")
+    date_str = str(frontmatter.get("date", ""))
+    category = frontmatter.get("category", "Blog")
+
+    return _CARD_TMPL.format_map({
+        "category": html.escape(category),
+        "display_date": _display_date(date_str),
+        "slug": slug,
+        "title": html.escape(title),
+        "description": html.escape(description),
+    })
+
+
+def generate_blog_cards(posts: list[tuple[dict, str]]) -> str:
+    """Render the /blog index cards for a batch of (frontmatter, slug)
+    pairs in one pass, newest first — one sort and one template for the
+    whole corpus instead of a process launch per card."""
+    ordered = sorted(posts, key=lambda p: str(p[0].get("date", "")), reverse=True)
+    return "\n".join(generate_blog_card(fm, slug) for fm, slug in ordered)
+
+
+def publish_post(input_path: Path, out_dir: Path) -> tuple[dict, str]:
+    """Convert one FINAL.md into `out_dir/<slug>.html`; returns the
+    parsed frontmatter and slug for index-card generation.
+
+    The pipeline is deterministic, so results are memoized by content
+    hash in `.publish-cache/` — an unchanged post skips markdown
+    conversion and page assembly entirely and is just copied out.
+    """
+    raw = input_path.read_bytes()
+    frontmatter, body = parse_frontmatter(raw.decode("utf-8"))
+    slug = slugify(frontmatter.get("title", input_path.parent.name))
+    output_file = out_dir / f"{slug}.html"
+
+    cached = _CACHE_DIR / f"{_page_cache_key(raw)}.html"
+    if cached.exists():
+        shutil.copyfile(cached, output_file)
+        return frontmatter, slug
+
+    # Encode once; write_bytes skips the codec pass write_text would
+    # repeat per destination.
+    html_bytes = build_html(frontmatter, body).encode("utf-8")
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cached.write_bytes(html_bytes)
+    output_file.write_bytes(html_bytes)
+    return frontmatter, slug
+
+
+def _publish_one(task: tuple[Path, Path]) -> tuple[dict, str]:
+    """Module-level (picklable) worker for the batch process pool."""
+    input_path, out_dir = task
+    return publish_post(input_path, out_dir)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Publish optimized blog posts as HTML")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to a single FINAL.md to publish")
+    source.add_argument("--input-dir", help="Publish every FINAL.md under this directory in one process")
+    parser.add_argument("--output-dir", default="published", help="Directory for generated HTML (default: published)")
+    parser.add_argument("--dry-run", action="store_true", help="Print HTML to stdout instead of writing (single --input only)")
+
+    args = parser.parse_args()
+
+    # Directory mode: one interpreter/import/template cost amortized over
+    # every post instead of paid per `python publish.py` invocation.
+    if args.input_dir:
+        files = sorted(Path(args.input_dir).rglob("FINAL.md"))
+        if not files:
+            print(f"No FINAL.md files under: {args.input_dir}")
+            sys.exit(1)
+        out_dir = Path(args.output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        # Each post is an independent CPU-bound transformation, so a big
+        # corpus fans out across processes; tiny batches stay serial —
+        # pool startup would cost more than it saves.
+        if len(files) < 4:
+            posts = [publish_post(p, out_dir) for p in files]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor() as ex:
+                posts = list(ex.map(_publish_one, [(p, out_dir) for p in files], chunksize=8))
+        for _, slug in posts:
+            print(f"Published: {out_dir / f'{slug}.html'}")
+        index_path = out_dir / "blog-list.html"
+        index_path.write_bytes((generate_blog_cards(posts) + "\n").encode("utf-8"))
+        print(f"\n{len(files)} posts published to {out_dir}/")
+        print(f"Blog index cards: {index_path}")
+        return
+
+    input_path = Path(args.input)
+    if not input_path.exists():
+        print(f"Input not found: {input_path}")
+        sys.exit(1)
+
+    if args.dry_run:
+        frontmatter, body = parse_frontmatter(input_path.read_bytes().decode("utf-8"))
+        if not frontmatter:
+            print("Warning: no frontmatter found — metadata will use fallbacks")
+        # Write pre-encoded bytes straight to the stdout buffer — print()
+        # would re-encode the whole page through the text wrapper.
+        sys.stdout.buffer.write(build_html(frontmatter, body).encode("utf-8"))
+        sys.stdout.buffer.flush()
+        return
+
+    out_dir = Path(args.output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    frontmatter, slug = publish_post(input_path, out_dir)
+    if not frontmatter:
+        print("Warning: no frontmatter found — metadata will use fallbacks")
+    print(f"Published: {out_dir / f'{slug}.html'}")
+    print("\nBlog index card (paste into /blog list):\n")
+    print(generate_blog_card(frontmatter, slug))
+
+
+if __name__ == "__main__":
+    main()